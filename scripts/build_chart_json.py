@@ -12,18 +12,31 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import json
+import math
 import os
 import sys
+import time
 
 from typing import Any, TypedDict
 
 import aiohttp
-
-from functions import get_json_files, get_stats_path, get_version_from_filename
+import orjson
+
+from functions import (
+    get_stats_files,
+    get_stats_path,
+    get_version_from_filename,
+    load_stats_file,
+)
 from logging_config import get_logger, setup_logging
 
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
 logger = get_logger(__name__)
 
 
@@ -37,39 +50,166 @@ CompletionData = dict[str, LocaleRecord]
 LocaleNameMap = dict[str, str]
 
 
-async def get_locale_names() -> LocaleNameMap:
+PONTOON_LOCALES_URL: str = (
+    "https://pontoon.mozilla.org/api/v2/locales/?fields=code,name"
+)
+
+ROOT_PATH: str = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir))
+OUTPUT_FILE: str = os.path.join(ROOT_PATH, "docs", "data", "data.json")
+
+# Locale names rarely change, keep them on disk for a day between runs
+LOCALE_NAMES_CACHE: str = os.path.join(ROOT_PATH, "docs", "data", ".locale_cache.json")
+LOCALE_NAMES_CACHE_TTL: int = 24 * 60 * 60
+
+
+def read_cached_locale_names() -> LocaleNameMap | None:
+    """
+    Read locale names from the on-disk cache.
+
+    Returns:
+        Cached locale names, or None if the cache is missing, stale or invalid
+    """
+    try:
+        if time.time() - os.path.getmtime(LOCALE_NAMES_CACHE) > LOCALE_NAMES_CACHE_TTL:
+            return None
+        with open(LOCALE_NAMES_CACHE, "rb") as f:
+            return orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+
+def write_cached_locale_names(locale_names: LocaleNameMap) -> None:
+    """
+    Store locale names in the on-disk cache.
+
+    The file is written to a temporary path first and then moved in place,
+    so an interrupted run never leaves a truncated cache behind.
+
+    Args:
+        locale_names: Dictionary mapping locale codes to display names
+    """
+    tmp_file = f"{LOCALE_NAMES_CACHE}.tmp"
+    try:
+        with open(tmp_file, "wb") as f:
+            f.write(orjson.dumps(locale_names))
+        os.replace(tmp_file, LOCALE_NAMES_CACHE)
+    except OSError as e:
+        logger.warning(f"Unable to write locale names cache: {e}")
+
+
+async def fetch_json(session: aiohttp.ClientSession, url: str) -> dict[str, Any]:
+    """
+    Fetch a single JSON document.
+
+    Args:
+        session: Active aiohttp session
+        url: URL to fetch
+
+    Returns:
+        Decoded JSON response
+
+    Raises:
+        aiohttp.ClientError: If the request fails
+    """
+    async with session.get(url) as response:
+        response.raise_for_status()
+        return await response.json()
+
+
+async def get_locale_names(session: aiohttp.ClientSession) -> LocaleNameMap:
     """
     Fetch locale names from Pontoon API asynchronously.
 
+    The first page is used to determine the total number of pages, the
+    remaining pages are then requested concurrently. If the API doesn't
+    report a count, the next links are followed instead. Results are cached
+    on disk for LOCALE_NAMES_CACHE_TTL seconds.
+
+    Args:
+        session: Shared aiohttp session
+
     Returns:
         Dictionary mapping locale codes to display names
 
     Raises:
         SystemExit: If API requests fail
     """
-    url: str | None = "https://pontoon.mozilla.org/api/v2/locales/?fields=code,name"
-    page = 1
+    cached_names = read_cached_locale_names()
+    if cached_names is not None:
+        logger.info("Reading locales from cache")
+        return cached_names
+
     locale_names: LocaleNameMap = {}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            while url:
+        logger.info("Reading locales (page 1)")
+        first_page = await fetch_json(session, PONTOON_LOCALES_URL)
+        pages: list[dict[str, Any]] = [first_page]
+
+        next_url = first_page.get("next")
+        page_size = len(first_page.get("results", []))
+        count = first_page.get("count")
+        if next_url and page_size and isinstance(count, int):
+            total_pages = math.ceil(count / page_size)
+            logger.info(f"Reading locales (pages 2-{total_pages})")
+            pages.extend(
+                await asyncio.gather(
+                    *(
+                        fetch_json(session, f"{PONTOON_LOCALES_URL}&page={page}")
+                        for page in range(2, total_pages + 1)
+                    )
+                )
+            )
+        else:
+            # Without a total count, follow the next links one page at a time
+            page = 2
+            while next_url:
                 logger.info(f"Reading locales (page {page})")
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data: dict[str, Any] = await response.json()
-                    for locale in data.get("results", {}):
-                        locale_names[locale["code"]] = locale["name"]
-                    # Get the next page URL
-                    url = data.get("next")
-                    page += 1
+                data = await fetch_json(session, next_url)
+                pages.append(data)
+                next_url = data.get("next")
+                page += 1
+
+        for data in pages:
+            for locale in data.get("results", []):
+                locale_names[locale["code"]] = locale["name"]
+        write_cached_locale_names(locale_names)
 
         return locale_names
-    except aiohttp.ClientError as e:
+    except (aiohttp.ClientError, TimeoutError) as e:
         logger.error(f"Error fetching data: {e}")
         sys.exit(1)
 
 
+async def load_product_stats(
+    versions: frozenset[str],
+) -> list[tuple[str, str, dict[str, float | int]]]:
+    """
+    Load statistics files for all products concurrently.
+
+    Args:
+        versions: Major versions to include
+
+    Returns:
+        List of (product, version, completion data) tuples, in file order
+    """
+    stats_path = get_stats_path()
+    stats_files: list[tuple[str, str, str]] = []
+    for product, json_files in get_stats_files(["fenix", "firefox"], versions).items():
+        for json_file in json_files:
+            version, _ = get_version_from_filename(json_file)
+            stats_files.append((product, version, os.path.join(stats_path, json_file)))
+
+    results = await asyncio.gather(
+        *(asyncio.to_thread(load_stats_file, path) for _, _, path in stats_files)
+    )
+
+    return [
+        (product, version, version_data)
+        for (product, version, _), version_data in zip(stats_files, results)
+    ]
+
+
 async def async_main(version: str) -> None:
     """
     Async main function for building chart data.
@@ -77,40 +217,37 @@ async def async_main(version: str) -> None:
     Args:
         version: Current version to use for filtering
     """
-    # Get locale names from Pontoon
-    locale_names = await get_locale_names()
-
     # Only extract data for the last X versions
     max_versions = 30
     version_int = int(version.split(".")[0])
-    versions = [str(v) for v in range(version_int, version_int - max_versions, -1)]
+    versions = frozenset(
+        str(v) for v in range(version_int, version_int - max_versions, -1)
+    )
 
-    stats_path = get_stats_path()
-    completion_data: CompletionData = {}
-    for product in ["fenix", "firefox"]:
-        # List all JSON files starting with the product name
-        json_files = get_json_files(product)
+    # Fetch locale names from Pontoon while reading the stats files, sharing
+    # one connection pool for every HTTP request in the run
+    connector = aiohttp.TCPConnector(limit=50, ttl_dns_cache=300)
+    timeout = aiohttp.ClientTimeout(total=30)
+    async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+        locale_names, product_stats = await asyncio.gather(
+            get_locale_names(session), load_product_stats(versions)
+        )
 
-        for json_file in json_files:
-            version, major_version = get_version_from_filename(json_file)
-            if major_version not in versions:
-                continue
-            with open(os.path.join(stats_path, json_file)) as f:
-                version_data: dict[str, float | int] = json.load(f)
-                for locale, percentage in version_data.items():
-                    if locale not in completion_data:
-                        completion_data[locale] = {
-                            "name": locale_names.get(locale, locale),
-                        }
-                    if product not in completion_data[locale]:
-                        completion_data[locale][product] = {}
-                    completion_data[locale][product][version] = percentage
-
-    output_file = os.path.abspath(
-        os.path.join(os.path.dirname(__file__), os.pardir, "docs", "data", "data.json")
-    )
-    with open(output_file, "w") as f:
-        json.dump(completion_data, f)
+    completion_data: CompletionData = {}
+    for product, version, version_data in product_stats:
+        for locale, percentage in version_data.items():
+            locale_record = completion_data.get(locale)
+            if locale_record is None:
+                locale_record = LocaleRecord(name=locale_names.get(locale, locale))
+                completion_data[locale] = locale_record
+            product_data: dict[str, float | int] | None = locale_record.get(product)
+            if product_data is None:
+                product_data = {}
+                locale_record[product] = product_data
+            product_data[version] = percentage
+
+    with open(OUTPUT_FILE, "wb") as f:
+        f.write(orjson.dumps(completion_data))
 
 
 def main() -> None:
@@ -126,7 +263,9 @@ def main() -> None:
     )
     args = cl_parser.parse_args()
 
-    asyncio.run(async_main(args.version))
+    # Use the libuv-based event loop where available (not on Windows)
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    asyncio.run(async_main(args.version), loop_factory=loop_factory)
 
 
 if __name__ == "__main__":
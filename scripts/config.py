@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
@@ -22,6 +23,49 @@ class ConfigError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=4)
+def _parse_config_file(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """
+    Parse a config file into a dictionary.
+
+    Results are cached per path, modification time and size, so the file is
+    only parsed again when it changes on disk.
+
+    Args:
+        path: Path to the config file
+        mtime_ns: Modification time of the file (cache key only)
+        size: Size of the file (cache key only)
+
+    Returns:
+        Dictionary mapping keys to values
+
+    Raises:
+        ConfigError: If the file has invalid format
+    """
+    paths: dict[str, str] = {}
+    for line_num, line in enumerate(Path(path).read_text().splitlines(), 1):
+        line = line.strip()
+
+        # Skip comments and empty lines
+        if not line or line[0] == "#":
+            continue
+
+        # Parse key=value
+        key, separator, value = line.partition("=")
+        if not separator:
+            raise ConfigError(f"Invalid config line {line_num}: missing '=' separator")
+
+        key = key.strip()
+        value = value.strip().strip("\"'")
+
+        if not key:
+            raise ConfigError(f"Invalid config line {line_num}: empty key")
+
+        paths[key] = value
+
+    return paths
+
+
 class Config:
     """Configuration manager for l10n-build-stats."""
 
@@ -41,6 +85,9 @@ class Config:
 
         self.config_path = config_path
         self._paths: dict[str, str] = {}
+        self._keys: tuple[str, ...] = ()
+        # Paths already known to exist, to avoid repeated stat calls
+        self._validated: set[str] = set()
         self._load()
 
     def _load(self) -> None:
@@ -50,33 +97,17 @@ class Config:
         Raises:
             ConfigError: If config file doesn't exist or has invalid format
         """
-        if not os.path.exists(self.config_path):
-            raise ConfigError(f"Config file not found: {self.config_path}")
+        try:
+            stat = os.stat(self.config_path)
+        except FileNotFoundError:
+            raise ConfigError(f"Config file not found: {self.config_path}") from None
 
         logger.debug(f"Loading config from {self.config_path}")
 
-        with open(self.config_path) as cfg_file:
-            for line_num, line in enumerate(cfg_file, 1):
-                line = line.strip()
-
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
-
-                # Parse key=value
-                if "=" not in line:
-                    raise ConfigError(
-                        f"Invalid config line {line_num}: missing '=' separator"
-                    )
-
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip().strip("\"'")
-
-                if not key:
-                    raise ConfigError(f"Invalid config line {line_num}: empty key")
-
-                self._paths[key] = value
+        self._paths = dict(
+            _parse_config_file(self.config_path, stat.st_mtime_ns, stat.st_size)
+        )
+        self._keys = tuple(self._paths)
 
         logger.debug(f"Loaded {len(self._paths)} config entries")
 
@@ -94,16 +125,17 @@ class Config:
         Raises:
             ConfigError: If key not found or path doesn't exist (when validate=True)
         """
-        if key not in self._paths:
+        value = self._paths.get(key)
+        if value is None:
             raise ConfigError(f"Configuration key '{key}' not found")
 
-        value = self._paths[key]
-
-        if validate and not os.path.exists(value):
-            raise ConfigError(
-                f"Path for '{key}' does not exist: {value}\n"
-                f"Please check your config file at {self.config_path}"
-            )
+        if validate and value not in self._validated:
+            if not os.path.exists(value):
+                raise ConfigError(
+                    f"Path for '{key}' does not exist: {value}\n"
+                    f"Please check your config file at {self.config_path}"
+                )
+            self._validated.add(value)
 
         return value
 
@@ -124,9 +156,9 @@ class Config:
         return tuple(self.get(key, validate=validate) for key in keys)
 
     @property
-    def all_keys(self) -> list[str]:
-        """Get list of all configuration keys."""
-        return list(self._paths.keys())
+    def all_keys(self) -> tuple[str, ...]:
+        """Get all configuration keys, in the order they appear in the file."""
+        return self._keys
 
 
 # Global config instance (lazy-loaded)
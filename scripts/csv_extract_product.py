@@ -14,12 +14,17 @@ from __future__ import annotations
 
 import argparse
 import csv
-import json
 import os
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import TypedDict
 
-from functions import get_json_files, get_stats_path, get_version_from_filename
+from functions import (
+    get_json_files,
+    get_stats_path,
+    get_version_from_filename,
+    load_stats_file,
+)
 
 
 class BuildEntry(TypedDict):
@@ -41,49 +46,56 @@ def main() -> None:
     product: str = args.product
     stats_path = get_stats_path()
 
-    # List all JSON files starting with the product name
-    json_files = get_json_files(product)
-
-    raw_build_data: dict[str, BuildEntry] = {}
-    version_majors: dict[str, str] = {}
-    locales: list[str] = []
-    for json_file in json_files:
-        with open(os.path.join(stats_path, json_file)) as f:
-            data: dict[str, float | int] = json.load(f)
-            version, major_version = get_version_from_filename(json_file)
-            for locale, percentage in data.items():
-                if version not in raw_build_data:
-                    raw_build_data[version] = {
-                        "version": version,
-                        "completion": {},
-                    }
-                    version_majors[version] = major_version
-                if locale not in locales:
-                    locales.append(locale)
-                raw_build_data[version]["completion"][locale] = percentage
-    locales.sort()
-
-    # Sort the dictionary by full version
-    build_data: dict[str, BuildEntry] = {
-        k: raw_build_data[k]
-        for k in sorted(
-            raw_build_data, key=lambda x: tuple(int(p) for p in x.split("."))
+    # List all JSON files starting with the product name, sorted by version
+    # so that the data is built in output order
+    stats_files: list[tuple[str, str, str]] = sorted(
+        (
+            (json_file, *get_version_from_filename(json_file))
+            for json_file in get_json_files(product)
+        ),
+        key=lambda x: tuple(int(p) for p in x[1].split(".")),
+    )
+
+    # Read files in parallel, merge them in version order
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        files_data = executor.map(
+            load_stats_file,
+            (os.path.join(stats_path, json_file) for json_file, _, _ in stats_files),
         )
+
+        build_data: dict[str, BuildEntry] = {}
+        version_majors: dict[str, str] = {}
+        all_locales: set[str] = set()
+        for (_, version, major_version), data in zip(stats_files, files_data):
+            if not data:
+                continue
+            entry = build_data.setdefault(
+                version, {"version": version, "completion": {}}
+            )
+            entry["completion"] |= data
+            version_majors[version] = major_version
+            all_locales |= data.keys()
+    locales = sorted(all_locales)
+
+    # Place each value directly in its locale column
+    locale_columns: dict[str, int] = {
+        locale: column for column, locale in enumerate(locales, start=2)
     }
+    rows: list[list[object]] = [["Version", "Major version", *locales]]
+    for version, version_data in build_data.items():
+        row: list[object] = [
+            f"'{version_data['version']}",  # Force string in Sheets
+            int(version_majors[version]),
+            *([""] * len(locales)),
+        ]
+        for locale, percentage in version_data["completion"].items():
+            row[locale_columns[locale]] = percentage
+        rows.append(row)
 
     csv_path = os.path.join(stats_path, f"{product}_locales.csv")
     with open(csv_path, "w") as csv_file:
-        fieldnames: list[str] = ["Version", "Major version"] + locales
-        writer = csv.DictWriter(csv_file, fieldnames=fieldnames, lineterminator="\n")
-
-        writer.writeheader()
-        for version, version_data in build_data.items():
-            row: dict[str, object] = {
-                "Version": f"'{version_data['version']}",  # Force string in Sheets
-                "Major version": int(version_majors[version]),
-            }
-            row.update(version_data["completion"])
-            writer.writerow(row)
+        writer = csv.writer(csv_file, lineterminator="\n")
+        writer.writerows(rows)
 
 
 if __name__ == "__main__":
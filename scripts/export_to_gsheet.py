@@ -48,12 +48,16 @@ def read_config(root_path: str) -> dict[str, str]:
     return dict(config.items("GDOCS"))
 
 
-def read_csv(csv_path: str) -> list[list[str]]:
-    with open(csv_path, encoding="utf-8") as f:
-        reader = csv.reader(f)
-        data: list[list[str]] = [row for row in reader]
+def read_csv(csv_path: str) -> tuple[list[list[str]], int]:
+    """Read a CSV file, returning its rows and the widest row length."""
+    data: list[list[str]] = []
+    cols = 0
+    with open(csv_path, newline="", encoding="utf-8") as f:
+        for row in csv.reader(f):
+            cols = max(cols, len(row))
+            data.append(row)
     # Guarantee at least a 1x1 range for empty files
-    return data if data else [[""]]
+    return (data, cols) if data else ([[""]], 1)
 
 
 def a1_from_rc(row: int, col: int) -> str:
@@ -90,32 +94,63 @@ def main() -> None:
     connection: gspread.Client = gspread.service_account_from_dict(credentials)
     sh: gspread.Spreadsheet = connection.open_by_key(config["spreadsheet_key"])
 
+    # Fetch the spreadsheet metadata once: it lists both the existing
+    # worksheets and the named ranges for all targets
+    meta: Mapping[str, Any] = sh.fetch_sheet_metadata()
+    sheet_ids: dict[str, int] = {
+        sheet["properties"]["title"]: sheet["properties"]["sheetId"]
+        for sheet in meta.get("sheets", []) or []
+    }
+    named_range_ids: dict[str, str] = {
+        nr["name"]: nr["namedRangeId"]
+        for nr in meta.get("namedRanges", []) or []
+        if nr.get("namedRangeId")
+    }
+
+    requests: list[dict[str, Any]] = []
+    value_ranges: list[dict[str, Any]] = []
+    uploaded: list[tuple[str, int, int]] = []
     for target_name in ("raw_firefox", "raw_fenix"):
         csv_path = os.path.join(
             root_path,
             "stats",
             target_name.removeprefix("raw_") + "_locales.csv",
         )
-        data: list[list[str]] = read_csv(csv_path)
+        data, cols = read_csv(csv_path)
         rows = len(data)
-        cols = max(len(r) for r in data) if data else 1
-
-        # Ensure worksheet exists with sufficient size
-        try:
-            ws: gspread.Worksheet = sh.worksheet(target_name)
-            ws.resize(rows=rows, cols=cols)
-            ws.clear()
-        except gspread.exceptions.WorksheetNotFound:
-            ws = sh.add_worksheet(
+
+        # Ensure worksheet exists with the exact size of the data
+        sheet_id: int | None = sheet_ids.get(target_name)
+        if sheet_id is None:
+            sheet_id = sh.add_worksheet(
                 title=target_name, rows=max(rows, 1), cols=max(cols, 1)
+            ).id
+        else:
+            requests.append(
+                {
+                    "updateSheetProperties": {
+                        "properties": {
+                            "sheetId": sheet_id,
+                            "gridProperties": {
+                                "rowCount": rows,
+                                "columnCount": cols,
+                            },
+                        },
+                        "fields": "gridProperties(rowCount,columnCount)",
+                    }
+                }
             )
 
-        # Write data starting at A1
-        ws.update(data, "A1", value_input_option=ValueInputOption.user_entered)
+        # Pad short rows, so that writing the data overwrites every cell of
+        # the resized worksheet and no separate clear is needed
+        value_ranges.append(
+            {
+                "range": f"'{target_name}'!A1",
+                "values": [row + [""] * (cols - len(row)) for row in data],
+            }
+        )
 
-        # Compute end A1 and update or add the named range on the spreadsheet
-        end_a1: str = a1_from_rc(rows, cols)
-        sheet_id: int = ws.id
+        # Update or add the named range on the spreadsheet
         range: dict[str, int] = {
             "sheetId": sheet_id,
             "startRowIndex": 0,
@@ -123,21 +158,13 @@ def main() -> None:
             "endRowIndex": rows,
             "endColumnIndex": cols,
         }
-
-        # Discover existing named ranges to get the ID (if present)
-        meta: Mapping[str, Any] = sh.fetch_sheet_metadata()
-        named_ranges: list[Mapping[str, Any]] = meta.get("namedRanges", []) or []
-        target: Mapping[str, Any] | None = next(
-            (nr for nr in named_ranges if nr.get("name") == target_name), None
-        )
-
-        requests: list[dict[str, Any]] = []
-        if target and target.get("namedRangeId"):
+        named_range_id: str | None = named_range_ids.get(target_name)
+        if named_range_id:
             requests.append(
                 {
                     "updateNamedRange": {
                         "namedRange": {
-                            "namedRangeId": target["namedRangeId"],
+                            "namedRangeId": named_range_id,
                             "name": target_name,
                             "range": range,
                         },
@@ -156,9 +183,19 @@ def main() -> None:
                     }
                 }
             )
+        uploaded.append((target_name, rows, cols))
+
+    # Resize worksheets and update named ranges first, then write all data
+    sh.batch_update({"requests": requests})
+    sh.values_batch_update(
+        {
+            "valueInputOption": ValueInputOption.user_entered,
+            "data": value_ranges,
+        }
+    )
 
-        sh.batch_update({"requests": requests})
-
+    for target_name, rows, cols in uploaded:
+        end_a1: str = a1_from_rc(rows, cols)
         logger.info(f"Uploaded {rows} rows x {cols} cols to sheet '{target_name}'.")
         logger.info(f"Named range '{target_name}' now refers to A1:{end_a1}.")
 
@@ -15,9 +15,18 @@ from __future__ import annotations
 import os
 import sys
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
 from base_stats import StatsExtractor
-from functions import StringList, parse_file, update_git_repository
-from logging_config import get_logger
+from functions import (
+    StringList,
+    find_existing_files,
+    parse_file_ids,
+    store_file_ids,
+    update_git_repository,
+)
+from logging_config import get_logger, get_worker_logging_args, setup_logging
 from moz.l10n.paths import L10nConfigPaths, get_android_locale
 
 
@@ -65,8 +74,11 @@ class FenixStatsExtractor(StatsExtractor):
         }
 
         string_list: StringList = {}
-        all_locales: list[str] = []
-        locales: list[str] = []
+        all_locales: set[str] = set()
+        # Files of all TOML configs are collected first, then parsed together in
+        # worker processes: (reference file, key) and (l10n file, key, locale)
+        reference_tasks: list[tuple[str, str]] = []
+        tasks: list[tuple[str, str, str]] = []
 
         for product, toml_path in toml_paths.items():
             if not os.path.exists(toml_path):
@@ -78,45 +90,75 @@ class FenixStatsExtractor(StatsExtractor):
                 toml_path, locale_map={"android_locale": get_android_locale}
             )
             basedir = project_config_paths.base
-            reference_files = [ref_path for ref_path in project_config_paths.ref_paths]
 
-            for reference_file in reference_files:
-                key = f"{product}:{os.path.relpath(reference_file, basedir)}"
-                parse_file(reference_file, key, "source", string_list, self.version)
+            # Keys only depend on the reference file, compute them once
+            reference_keys: dict[str, str] = {
+                ref_path: f"{product}:{os.path.relpath(ref_path, basedir)}"
+                for ref_path in project_config_paths.ref_paths
+            }
+            reference_tasks.extend(reference_keys.items())
 
-            locales = list(project_config_paths.all_locales)
-            locales.sort()
+            locales = sorted(project_config_paths.all_locales)
             # Storing a superset of all locales across TOML files
-            all_locales = list(set(locales + all_locales))
-
-            all_files = [
-                (ref_path, tgt_path)
-                for (ref_path, tgt_path), _ in project_config_paths.all().items()
+            all_locales.update(locales)
+
+            # Only the (reference, target) path pairs are needed
+            all_files: tuple[tuple[str, str], ...] = tuple(project_config_paths.all())
+            target_files = [
+                (
+                    ref_path,
+                    project_config_paths.format_target_path(raw_tgt_path, locale),
+                    locale,
+                )
+                for locale in locales
+                for ref_path, raw_tgt_path in all_files
             ]
-            for locale in locales:
-                locale_files = [
-                    (ref_path, tgt_path)
-                    for (ref_path, raw_tgt_path) in all_files
-                    if os.path.exists(
-                        tgt_path := project_config_paths.format_target_path(
-                            raw_tgt_path, locale
-                        )
+            existing_files = find_existing_files(
+                l10n_file for _, l10n_file, _ in target_files
+            )
+
+            for source_file, l10n_file, locale in target_files:
+                # Ignore missing files for locale
+                if l10n_file not in existing_files:
+                    continue
+                key = reference_keys.get(source_file)
+                if key is None:
+                    logger.warning(
+                        f"Extra file {os.path.relpath(l10n_file, basedir)} in {locale}"
                     )
-                ]
-
-                for source_file, l10n_file in locale_files:
-                    # Ignore missing files for locale
-                    if not os.path.exists(l10n_file):
-                        continue
-                    key = f"{product}:{os.path.relpath(source_file, basedir)}"
-                    if key not in string_list:
-                        logger.warning(
-                            f"Extra file {os.path.relpath(l10n_file, basedir)} in {locale}"
-                        )
-                        continue
-                    parse_file(l10n_file, key, locale, string_list, self.version)
-
-        return string_list, locales
+                    continue
+                tasks.append((l10n_file, key, locale))
+
+        with ProcessPoolExecutor(
+            initializer=setup_logging, initargs=get_worker_logging_args()
+        ) as executor:
+            # Submit reference and locale files together, so that workers don't
+            # sit idle between the two
+            source_results = executor.map(
+                parse_file_ids,
+                [reference_file for reference_file, _ in reference_tasks],
+                [key for _, key in reference_tasks],
+                repeat("source"),
+                repeat(self.version),
+                chunksize=16,
+            )
+            locale_results = executor.map(
+                parse_file_ids,
+                [l10n_file for l10n_file, _, _ in tasks],
+                [key for _, key, _ in tasks],
+                [locale for _, _, locale in tasks],
+                repeat(self.version),
+                chunksize=16,
+            )
+
+            # Merge results in the main process. Reference files must be stored
+            # first, since locale IDs are filtered against them
+            for (_, key), ids in zip(reference_tasks, source_results):
+                store_file_ids(string_list, key, "source", ids)
+            for (_, key, locale), ids in zip(tasks, locale_results):
+                store_file_ids(string_list, key, locale, ids)
+
+        return string_list, sorted(all_locales)
 
 
 def main() -> None:
@@ -12,13 +12,23 @@ python firefox_stats.py --version 147.0
 
 from __future__ import annotations
 
-import json
 import os
 import sys
 
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+import orjson
+
 from base_stats import StatsExtractor
-from functions import StringList, parse_file, update_git_repository
-from logging_config import get_logger
+from functions import (
+    StringList,
+    find_existing_files,
+    parse_file_ids,
+    store_file_ids,
+    update_git_repository,
+)
+from logging_config import get_logger, get_worker_logging_args, setup_logging
 from moz.l10n.paths import L10nConfigPaths
 
 
@@ -64,8 +74,8 @@ class FirefoxStatsExtractor(StatsExtractor):
         l10n_changesets: str = os.path.join(
             source_path, "browser", "locales", "l10n-changesets.json"
         )
-        with open(l10n_changesets) as f:
-            data: dict[str, dict[str, str]] = json.load(f)
+        with open(l10n_changesets, "rb") as f:
+            data: dict[str, dict[str, str]] = orjson.loads(f.read())
             return data["it"]["revision"]
 
     def extract_string_list(self, *paths: str) -> tuple[StringList, list[str]]:
@@ -92,9 +102,7 @@ class FirefoxStatsExtractor(StatsExtractor):
             source_path, "browser", "locales", "shipped-locales"
         )
         with open(locales_path) as f:
-            locales: list[str] = f.read().splitlines()
-        locales.remove("en-US")
-        locales.sort()
+            locales: list[str] = sorted(set(f.read().splitlines()) - {"en-US"})
 
         string_list: StringList = {}
 
@@ -102,27 +110,64 @@ class FirefoxStatsExtractor(StatsExtractor):
         basedir = project_config_paths.base
         reference_files = [ref_path for ref_path in project_config_paths.ref_paths]
 
-        for reference_file in reference_files:
-            rel_file: str = os.path.relpath(reference_file, basedir)
-            parse_file(reference_file, rel_file, "source", string_list)
-
+        rel_files: list[str] = [
+            os.path.relpath(reference_file, basedir)
+            for reference_file in reference_files
+        ]
+
+        # Collect locale files first, then parse them in worker processes
+        tasks: list[tuple[str, str, str]] = []
+        # Paths in the l10n repository don't include "locales/en-US"
+        l10n_rel_files: dict[str, str] = {
+            rel_file: rel_file.replace("locales/en-US/", "") for rel_file in rel_files
+        }
         for locale in locales:
             missing_files: list[str] = []
-            for rel_file in string_list:
-                l10n_file_name: str = os.path.join(
-                    l10n_path, locale, rel_file.replace("locales/en-US/", "")
-                )
-                if not os.path.exists(l10n_file_name):
+            locale_path: str = os.path.join(l10n_path, locale)
+            l10n_files: dict[str, str] = {
+                rel_file: os.path.join(locale_path, l10n_rel_file)
+                for rel_file, l10n_rel_file in l10n_rel_files.items()
+            }
+            existing_files = find_existing_files(l10n_files.values())
+            for rel_file, l10n_file_name in l10n_files.items():
+                if l10n_file_name not in existing_files:
                     missing_files.append(os.path.relpath(l10n_file_name, l10n_path))
                     continue
 
-                parse_file(l10n_file_name, rel_file, locale, string_list)
+                tasks.append((l10n_file_name, rel_file, locale))
             if missing_files:
+                missing_list = "\n  ".join(missing_files)
                 logger.warning(
                     f"Missing {len(missing_files)} files for locale {locale}:"
+                    f"\n  {missing_list}"
                 )
-                for missing_file in missing_files:
-                    logger.warning(f"  {missing_file}")
+
+        with ProcessPoolExecutor(
+            initializer=setup_logging, initargs=get_worker_logging_args()
+        ) as executor:
+            # Submit reference and locale files together, so that workers don't
+            # sit idle between the two
+            source_results = executor.map(
+                parse_file_ids,
+                reference_files,
+                rel_files,
+                repeat("source"),
+                chunksize=16,
+            )
+            locale_results = executor.map(
+                parse_file_ids,
+                [l10n_file for l10n_file, _, _ in tasks],
+                [rel_file for _, rel_file, _ in tasks],
+                [locale for _, _, locale in tasks],
+                chunksize=16,
+            )
+
+            # Merge results in the main process. Reference files must be stored
+            # first, since locale IDs are filtered against them
+            for rel_file, ids in zip(rel_files, source_results):
+                store_file_ids(string_list, rel_file, "source", ids)
+            for (_, rel_file, locale), ids in zip(tasks, locale_results):
+                store_file_ids(string_list, rel_file, locale, ids)
 
         return string_list, locales
 
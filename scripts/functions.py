@@ -1,10 +1,14 @@
+import functools
 import json
 import os
 import re
 import subprocess
 
+from collections.abc import Container, Iterable
 from re import Match, Pattern
 
+import orjson
+
 from logging_config import get_logger
 from moz.l10n.formats import UnsupportedFormat
 from moz.l10n.model import Entry
@@ -14,15 +18,15 @@ from moz.l10n.resource import parse_resource
 logger = get_logger(__name__)
 
 
-StringList = dict[str, dict[str, list[str]]]
+StringList = dict[str, dict[str, set[str]]]
 
 
 def store_completion(
-    string_list: dict[str, dict[str, list[str]]],
+    string_list: StringList,
     version: str,
     locales: list[str],
     product: str,
-) -> None:
+) -> dict[str, float]:
     """
     Calculate and store localization completion statistics to a JSON file.
 
@@ -32,23 +36,27 @@ def store_completion(
         locales: List of locale codes to process
         product: Product name ("firefox" or "fenix")
 
+    Returns:
+        Dictionary mapping locale codes to completion ratios, as written
+
     Raises:
         ZeroDivisionError: If source has no strings (shouldn't happen)
         OSError: If output file can't be written
     """
-    completion: dict[str, float] = {}
     stats_path = get_stats_path()
-    source_stats: int = sum(
-        len(values.get("source", [])) for values in string_list.values()
-    )
 
-    for locale in locales:
-        if locale == "source":
-            continue
-        locale_stats: int = sum(
-            len(values.get(locale, [])) for values in string_list.values()
-        )
-        completion[locale] = round((locale_stats / source_stats), 4)
+    # Count strings for all locales in a single pass over the files
+    string_counts: dict[str, int] = {}
+    for values in string_list.values():
+        for locale, ids in values.items():
+            string_counts[locale] = string_counts.get(locale, 0) + len(ids)
+    source_stats: int = string_counts.get("source", 0)
+
+    completion: dict[str, float] = {
+        locale: round(string_counts.get(locale, 0) / source_stats, 4)
+        for locale in locales
+        if locale != "source"
+    }
 
     for locale, percentage in completion.items():
         logger.info(f"{locale}: {round(percentage * 100, 2)}%")
@@ -56,9 +64,16 @@ def store_completion(
     output_file: str = os.path.join(
         stats_path, f"{product}_{version.replace('.', '_')}.json"
     )
+    # Write with the json module, so that the output matches the format of the
+    # stats files already committed (orjson has no separator options)
     with open(output_file, "w") as f:
         json.dump(completion, f)
 
+    return completion
+
+
+_TAG_RE: Pattern[str] = re.compile(r"(FIREFOX_([0-9_]*)_RELEASE)")
+
 
 def get_firefox_releases(repo_path: str) -> dict[str, str]:
     """
@@ -75,36 +90,30 @@ def get_firefox_releases(repo_path: str) -> dict[str, str]:
     """
     logger.info("Extracting tags from repository")
     result = subprocess.run(
-        ["git", "-C", repo_path, "tag", "-l", "FIREFOX_*"],
+        ["git", "-C", repo_path, "tag", "-l", "FIREFOX_*_RELEASE"],
         capture_output=True,
         text=True,
     )
     if result.returncode != 0:
         raise RuntimeError(f"Error running git tag: {result.stderr}")
 
-    # Filter output using regex
-    output: str = result.stdout
-    tag_re: Pattern[str] = re.compile(r"(FIREFOX_([0-9_]*)_RELEASE)")
-    filtered_lines: list[str] = [
-        line for line in output.splitlines() if tag_re.search(line)
-    ]
-
-    # Process the filtered lines to extract version
-    releases: dict[str, str] = {}
-    for line in filtered_lines:
-        match: Match[str] | None = tag_re.search(line)
-        if match:
-            tag_name: str = match.group(1)
-            version: str = match.group(2).replace("_", ".")
-            releases[version] = tag_name
+    # Extract versions from matching tags in a single pass over the output
+    releases: dict[str, str] = {
+        match.group(2).replace("_", "."): match.group(1)
+        for match in _TAG_RE.finditer(result.stdout)
+    }
 
     return releases
 
 
+@functools.lru_cache(maxsize=1)
 def get_stats_path() -> str:
     """
     Get the absolute path to the stats directory.
 
+    The path only depends on the location of this module, so it's computed
+    once and cached.
+
     Returns:
         Absolute path to the stats directory
     """
@@ -125,13 +134,28 @@ def update_git_repository(changeset: str, repo_path: str) -> None:
     logger.info(f"Updating git repository to changeset: {changeset}")
     result = subprocess.run(
         ["git", "-C", repo_path, "checkout", changeset],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
         text=True,
     )
     if result.returncode != 0:
         raise RuntimeError(f"Error updating repository to {changeset}: {result.stderr}")
 
 
+def load_stats_file(path: str) -> dict[str, float | int]:
+    """
+    Load a single completion statistics file.
+
+    Args:
+        path: Absolute path to the JSON file
+
+    Returns:
+        Dictionary mapping locale codes to completion levels
+    """
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
 def get_json_files(product: str) -> list[str]:
     """
     List all JSON statistics files for a given product.
@@ -142,19 +166,48 @@ def get_json_files(product: str) -> list[str]:
     Returns:
         Sorted list of JSON filenames for the product
     """
-    # List all JSON files starting with the product name
-    stats_path = get_stats_path()
-    json_files = [
-        f
-        for f in os.listdir(stats_path)
-        if f.startswith(product) and f.endswith(".json")
-    ]
-    json_files.sort()
+    return get_stats_files([product])[product]
+
+
+def get_stats_files(
+    products: Iterable[str], major_versions: Container[str] | None = None
+) -> dict[str, list[str]]:
+    """
+    List JSON statistics files for several products in a single directory scan.
+
+    Args:
+        products: Product names (e.g. ["fenix", "firefox"])
+        major_versions: If set, only keep files for these major versions
+            (e.g. {"149", "150"})
+
+    Returns:
+        Dictionary mapping each product to its sorted list of JSON filenames
+    """
+    stats_files: dict[str, list[str]] = {product: [] for product in products}
+    with os.scandir(get_stats_path()) as entries:
+        for entry in entries:
+            if not entry.name.endswith(".json"):
+                continue
+            product, _, version = entry.name.removesuffix(".json").partition("_")
+            if product not in stats_files:
+                continue
+            # Skip directories and symlinks named like stats files
+            if not entry.is_file(follow_symlinks=False):
+                continue
+            if (
+                major_versions is not None
+                and version.split("_", 1)[0] not in major_versions
+            ):
+                continue
+            stats_files[product].append(entry.name)
 
-    return json_files
+    for filenames in stats_files.values():
+        filenames.sort()
 
+    return stats_files
 
-_VERSION_FILENAME_RE: Pattern[str] = re.compile(r"^[a-z]+_(\d+(?:_\d+)*)\.json$")
+
+_VERSION_FILENAME_RE: Pattern[str] = re.compile(r"[a-z]+_(\d+(?:_\d+)*)\.json")
 
 
 def get_version_from_filename(filename: str) -> tuple[str, str]:
@@ -171,7 +224,7 @@ def get_version_from_filename(filename: str) -> tuple[str, str]:
         ValueError: If filename does not match the expected
             "<product>_<digits>_<digits>...json" pattern.
     """
-    match: Match[str] | None = _VERSION_FILENAME_RE.match(filename)
+    match: Match[str] | None = _VERSION_FILENAME_RE.fullmatch(filename)
     if match is None:
         raise ValueError(f"Unrecognized stats filename: {filename!r}")
     version: str = match.group(1).replace("_", ".")
@@ -180,51 +233,95 @@ def get_version_from_filename(filename: str) -> tuple[str, str]:
     return version, major_version
 
 
-def parse_file(
+def find_existing_files(paths: Iterable[str]) -> set[str]:
+    """
+    Find which of the given paths exist.
+
+    Each parent directory is listed once with os.scandir(), instead of
+    checking every path with a separate stat call.
+
+    Args:
+        paths: File paths to check
+
+    Returns:
+        Set of the paths that exist
+    """
+    listings: dict[str, set[str]] = {}
+    existing: set[str] = set()
+    for path in paths:
+        parent, name = os.path.split(path)
+        names = listings.get(parent)
+        if names is None:
+            try:
+                with os.scandir(parent or os.curdir) as entries:
+                    names = {entry.name for entry in entries}
+            except OSError:
+                # Missing folder, or not a folder
+                names = set()
+            listings[parent] = names
+        if name in names:
+            existing.add(path)
+
+    return existing
+
+
+_REMOVED_IN_META = "{http://mozac.org/tools}removedIn"
+_TOOLS_IGNORE_META = "{http://schemas.android.com/tools}ignore"
+
+
+def parse_file_ids(
     file_path: str,
     rel_file: str,
     locale: str,
-    string_list: StringList,
     version: str = "",
-) -> None:
+) -> list[str]:
     """
-    Parse a localization file and extract string IDs.
+    Parse a localization file and return its string IDs.
+
+    For reference files, strings excluded by Android meta attributes are
+    skipped. For locale files, all IDs are returned: filtering against the
+    reference is done by store_file_ids().
+
+    This function has no side effects on shared state, so it can run in
+    worker processes.
 
     Args:
         file_path: Absolute path to the file to parse
-        rel_file: Relative file path (used as dict key)
+        rel_file: Relative file path (used in log messages)
         locale: Locale code ("source" for reference files)
-        string_list: Dict to update with parsed string IDs
         version: Product version (for Android removedIn meta check)
 
-    Side effects:
-        Updates string_list dict with parsed string IDs
+    Returns:
+        List of string IDs, including attributes as "<id>.<attribute>"
     """
-
-    def store(id: str) -> None:
-        string_list[rel_file][locale].append(id)
+    ids: list[str] = []
+    major_version = int(version.split(".")[0]) if version else 0
 
     def meta_include(entry: Entry) -> bool:
-        if entry.meta is None:
+        if not entry.meta:
             return True
 
-        removed_in = entry.get_meta("{http://mozac.org/tools}removedIn")
-        removed = removed_in and int(removed_in) < int(version.split(".")[0])
+        # Read both attributes in one pass (first value wins, like get_meta)
+        removed_in: str | None = None
+        tools_ignore: str | None = None
+        for meta in entry.meta:
+            if meta.key == _REMOVED_IN_META and removed_in is None:
+                removed_in = meta.value
+            elif meta.key == _TOOLS_IGNORE_META and tools_ignore is None:
+                tools_ignore = meta.value
+
+        removed = removed_in and int(removed_in) < major_version
         if removed:
-            logger.debug(f"Ignoring {entry_id} because removed in version {removed_in}")
+            logger.debug(
+                "Ignoring %s because removed in version %s", entry_id, removed_in
+            )
 
-        tools_ignore = entry.get_meta("{http://schemas.android.com/tools}ignore")
-        unused = "UnusedResources" in str(tools_ignore).split(",")
+        unused = bool(tools_ignore) and "UnusedResources" in tools_ignore.split(",")
         if unused and not removed:
-            logger.debug(f"Ignoring {entry_id} because marked as UnusedResources")
+            logger.debug("Ignoring %s because marked as UnusedResources", entry_id)
 
         return not (unused or removed)
 
-    if rel_file not in string_list:
-        string_list[rel_file] = {}
-    if locale not in string_list[rel_file]:
-        string_list[rel_file][locale] = []
-
     try:
         resource = parse_resource(file_path)
         for section in resource.sections:
@@ -233,11 +330,8 @@ def parse_file(
                     continue
 
                 entry_id = ".".join(section.id + entry.id)
-                if locale == "source":
-                    if meta_include(entry):
-                        store(entry_id)
-                elif entry_id in string_list[rel_file]["source"]:
-                    store(entry_id)
+                if locale != "source" or meta_include(entry):
+                    ids.append(entry_id)
 
                 """
                 This step is not strictly necessary: we could just look at
@@ -247,15 +341,41 @@ def parse_file(
                 """
                 if entry.properties:
                     for attribute in entry.properties:
-                        attr_id = f"{entry_id}.{attribute}"
-                        if (
-                            locale == "source"
-                            or attr_id in string_list[rel_file]["source"]
-                        ):
-                            store(attr_id)
+                        ids.append(f"{entry_id}.{attribute}")
     except UnsupportedFormat:
         if locale == "source":
             logger.warning(f"Unsupported format: {rel_file}")
     except Exception as e:
         logger.error(f"Error parsing file: {rel_file}")
         logger.error(e)
+
+    return ids
+
+
+def store_file_ids(
+    string_list: StringList,
+    rel_file: str,
+    locale: str,
+    ids: list[str],
+) -> None:
+    """
+    Store string IDs parsed from a file.
+
+    IDs for locale files are only stored if they also exist in the
+    reference file, which must be stored first.
+
+    Args:
+        string_list: Dict to update with string IDs
+        rel_file: Relative file path (used as dict key)
+        locale: Locale code ("source" for reference files)
+        ids: String IDs returned by parse_file_ids()
+
+    Side effects:
+        Updates string_list dict with the string IDs
+    """
+    file_ids = string_list.setdefault(rel_file, {})
+    locale_ids = file_ids.setdefault(locale, set())
+    if locale == "source":
+        locale_ids.update(ids)
+    else:
+        locale_ids.update(file_ids["source"].intersection(ids))
@@ -6,6 +6,7 @@ import logging
 import os
 import sys
 
+from collections.abc import Mapping
 from pathlib import Path
 
 
@@ -15,6 +16,30 @@ VERBOSE_FORMAT = (
     "%(asctime)s - %(name)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s"
 )
 
+# Resolved (level, format_string, log_file) of the last setup_logging() call,
+# used to configure logging the same way in worker processes
+_worker_args: tuple[int, str, str | None] | None = None
+
+
+def _resolve_level(
+    level: int | str | None, env: Mapping[str, str] | None = None
+) -> int:
+    """
+    Resolve the numeric logging level.
+
+    Args:
+        level: Explicit level name or number. If None, LOG_LEVEL is used.
+        env: Environment to read LOG_LEVEL from. Defaults to os.environ.
+
+    Returns:
+        Logging level, INFO if the name is not recognized
+    """
+    if isinstance(level, int):
+        return level
+    if level is None:
+        level = (os.environ if env is None else env).get("LOG_LEVEL", "INFO")
+    return getattr(logging, level.upper(), logging.INFO)
+
 
 def setup_logging(
     level: int | str | None = None,
@@ -36,12 +61,7 @@ def setup_logging(
         LOG_LEVEL: Set default logging level (e.g., "DEBUG", "INFO")
         LOG_FILE: Set default log file path
     """
-    # Determine log level
-    if level is None:
-        level_str = os.environ.get("LOG_LEVEL", "INFO").upper()
-        level = getattr(logging, level_str, logging.INFO)
-    elif isinstance(level, str):
-        level = getattr(logging, level.upper(), logging.INFO)
+    level = _resolve_level(level)
 
     # Determine format
     if format_string is None:
@@ -51,20 +71,25 @@ def setup_logging(
     if log_file is None:
         log_file = os.environ.get("LOG_FILE")
 
-    # Configure handlers
+    global _worker_args
+    _worker_args = (level, format_string, log_file)
+
+    # Configure handlers, sharing a single formatter
     handlers: list[logging.Handler] = []
+    formatter = logging.Formatter(format_string)
 
     # Console handler (always present)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(format_string))
+    console_handler.setFormatter(formatter)
     handlers.append(console_handler)
 
     # File handler (optional)
     if log_file:
         log_path = Path(log_file)
         log_path.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(format_string))
+        # Only open the file once the first record is written
+        file_handler = logging.FileHandler(log_file, delay=True)
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
     # Configure root logger
@@ -81,6 +106,21 @@ def setup_logging(
     logging.getLogger("gspread").setLevel(logging.WARNING)
 
 
+def get_worker_logging_args() -> tuple[int | None, str | None, str | None]:
+    """
+    Get setup_logging() arguments to configure logging in worker processes.
+
+    Pass them as initargs, with setup_logging as the initializer of a process
+    pool. Workers started with spawn (the default on macOS) don't inherit the
+    logging configuration of the main process.
+
+    Returns:
+        Tuple of (level, format_string, log_file), all None if logging was
+        not set up yet
+    """
+    return _worker_args or (None, None, None)
+
+
 def get_logger(name: str) -> logging.Logger:
     """
     Get a logger instance for a module.
@@ -1,21 +1,30 @@
 """Shared pytest fixtures and configuration."""
 
+import os
+import sys
+
 import pytest
 
 
+# Make the scripts importable from all test modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+
+from config import Config
+
+
 @pytest.fixture
 def sample_string_list():
     """Sample string list for testing."""
     return {
         "browser/firefox.ftl": {
-            "source": ["app-name", "menu-file", "menu-edit"],
-            "it": ["app-name", "menu-file"],
-            "fr": ["app-name"],
+            "source": {"app-name", "menu-file", "menu-edit"},
+            "it": {"app-name", "menu-file"},
+            "fr": {"app-name"},
         },
         "browser/aboutDialog.ftl": {
-            "source": ["update-check", "update-available"],
-            "it": ["update-check", "update-available"],
-            "fr": ["update-check"],
+            "source": {"update-check", "update-available"},
+            "it": {"update-check", "update-available"},
+            "fr": {"update-check"},
         },
     }
 
@@ -24,3 +33,28 @@ def sample_string_list():
 def sample_locales():
     """Sample locale list for testing."""
     return ["source", "it", "fr", "de"]
+
+
+@pytest.fixture(scope="session")
+def valid_config(tmp_path_factory):
+    """Config loaded once from a valid file, shared by read-only tests."""
+    config_file = tmp_path_factory.mktemp("config") / "config"
+    config_file.write_text(
+        """
+# Comment line
+mozilla_firefox_path="/path/to/firefox"
+l10n_path=/path/to/l10n
+
+# Another comment
+stats_path = "/path/to/stats"
+key1="value1"
+key2="value2"
+# comment
+key3="value3"
+double_quoted="value with double quotes"
+single_quoted='value with single quotes'
+no_quotes=value without quotes
+"""
+    )
+
+    return Config(str(config_file))
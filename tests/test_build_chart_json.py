@@ -0,0 +1,149 @@
+"""Tests for build_chart_json module."""
+
+import asyncio
+import json
+import os
+import time
+
+from unittest.mock import patch
+
+import pytest
+
+from build_chart_json import (
+    LOCALE_NAMES_CACHE_TTL,
+    PONTOON_LOCALES_URL,
+    get_locale_names,
+    read_cached_locale_names,
+    write_cached_locale_names,
+)
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    """Point the locale names cache to a temporary file."""
+    path = tmp_path / ".locale_cache.json"
+    with patch("build_chart_json.LOCALE_NAMES_CACHE", str(path)):
+        yield path
+
+
+def fetch_pages(pages):
+    """Build a fetch_json stub serving the given pages by URL."""
+    requested = []
+
+    async def fetch_json(session, url):
+        requested.append(url)
+        return pages[url]
+
+    return fetch_json, requested
+
+
+def locales_page(codes, next_url=None, count=None):
+    """Build a Pontoon API page with the given locale codes."""
+    page = {
+        "next": next_url,
+        "results": [{"code": code, "name": f"Name {code}"} for code in codes],
+    }
+    if count is not None:
+        page["count"] = count
+    return page
+
+
+class TestGetLocaleNames:
+    """Tests for get_locale_names function."""
+
+    def test_single_page(self, cache_file):
+        """Test that no other page is requested without a next link."""
+        fetch_json, requested = fetch_pages(
+            {PONTOON_LOCALES_URL: locales_page(["de", "it"], count=2)}
+        )
+
+        with patch("build_chart_json.fetch_json", fetch_json):
+            locale_names = asyncio.run(get_locale_names(None))
+
+        assert locale_names == {"de": "Name de", "it": "Name it"}
+        assert requested == [PONTOON_LOCALES_URL]
+
+    def test_requests_remaining_pages_from_count(self, cache_file):
+        """Test that page URLs are built from the count of the first page."""
+        page2 = f"{PONTOON_LOCALES_URL}&page=2"
+        page3 = f"{PONTOON_LOCALES_URL}&page=3"
+        fetch_json, requested = fetch_pages(
+            {
+                PONTOON_LOCALES_URL: locales_page(["de", "fr"], page2, count=5),
+                page2: locales_page(["it", "ja"], page3, count=5),
+                page3: locales_page(["sl"], count=5),
+            }
+        )
+
+        with patch("build_chart_json.fetch_json", fetch_json):
+            locale_names = asyncio.run(get_locale_names(None))
+
+        assert list(locale_names) == ["de", "fr", "it", "ja", "sl"]
+        assert requested == [PONTOON_LOCALES_URL, page2, page3]
+
+    def test_follows_next_links_without_count(self, cache_file):
+        """Test that pages are walked sequentially if count is missing."""
+        fetch_json, requested = fetch_pages(
+            {
+                PONTOON_LOCALES_URL: locales_page(["de"], "next-1"),
+                "next-1": locales_page(["it"], "next-2"),
+                "next-2": locales_page(["sl"]),
+            }
+        )
+
+        with patch("build_chart_json.fetch_json", fetch_json):
+            locale_names = asyncio.run(get_locale_names(None))
+
+        assert list(locale_names) == ["de", "it", "sl"]
+        assert requested == [PONTOON_LOCALES_URL, "next-1", "next-2"]
+
+    def test_writes_and_uses_cache(self, cache_file):
+        """Test that fetched names are cached and reused by the next call."""
+        fetch_json, requested = fetch_pages(
+            {PONTOON_LOCALES_URL: locales_page(["de"], count=1)}
+        )
+
+        with patch("build_chart_json.fetch_json", fetch_json):
+            first = asyncio.run(get_locale_names(None))
+            second = asyncio.run(get_locale_names(None))
+
+        assert first == second == {"de": "Name de"}
+        assert requested == [PONTOON_LOCALES_URL]
+        assert json.loads(cache_file.read_text()) == {"de": "Name de"}
+
+
+class TestLocaleNamesCache:
+    """Tests for read_cached_locale_names and write_cached_locale_names."""
+
+    def test_round_trip(self, cache_file):
+        """Test that written names are read back."""
+        write_cached_locale_names({"it": "Italian"})
+
+        assert read_cached_locale_names() == {"it": "Italian"}
+
+    def test_missing_cache(self, cache_file):
+        """Test that a missing cache is ignored."""
+        assert read_cached_locale_names() is None
+
+    def test_expired_cache(self, cache_file):
+        """Test that a cache older than the TTL is ignored."""
+        write_cached_locale_names({"it": "Italian"})
+        mtime = time.time() - LOCALE_NAMES_CACHE_TTL - 60
+        os.utime(cache_file, (mtime, mtime))
+
+        assert read_cached_locale_names() is None
+
+    def test_invalid_json(self, cache_file):
+        """Test that an unreadable cache is ignored."""
+        cache_file.write_text('{"it": "Ital')
+
+        assert read_cached_locale_names() is None
+
+    def test_failed_write_keeps_previous_cache(self, cache_file):
+        """Test that the cache is only replaced once fully written."""
+        write_cached_locale_names({"it": "Italian"})
+
+        with patch("build_chart_json.os.replace", side_effect=OSError("denied")):
+            write_cached_locale_names({"it": "Italiano"})
+
+        assert read_cached_locale_names() == {"it": "Italian"}
@@ -1,12 +1,10 @@
 """Tests for config module."""
 
 import os
-import sys
-
-import pytest
 
+from unittest.mock import patch
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import pytest
 
 from config import Config, ConfigError
 
@@ -14,21 +12,9 @@ from config import Config, ConfigError
 class TestConfig:
     """Tests for Config class."""
 
-    def test_load_valid_config(self, tmp_path):
+    def test_load_valid_config(self, valid_config):
         """Test loading a valid config file."""
-        config_file = tmp_path / "config"
-        config_file.write_text(
-            """
-# Comment line
-mozilla_firefox_path="/path/to/firefox"
-l10n_path=/path/to/l10n
-
-# Another comment
-stats_path = "/path/to/stats"
-"""
-        )
-
-        config = Config(str(config_file))
+        config = valid_config
         assert config.get("mozilla_firefox_path", validate=False) == "/path/to/firefox"
         assert config.get("l10n_path", validate=False) == "/path/to/l10n"
         assert config.get("stats_path", validate=False) == "/path/to/stats"
@@ -84,13 +70,9 @@ stats_path = "/path/to/stats"
         # Should work without validation
         assert config.get("fake_path", validate=False) == "/fake/path"
 
-    def test_get_multiple(self, tmp_path):
+    def test_get_multiple(self, valid_config):
         """Test getting multiple config values."""
-        config_file = tmp_path / "config"
-        config_file.write_text('key1="value1"\nkey2="value2"\nkey3="value3"')
-
-        config = Config(str(config_file))
-        values = config.get_multiple(["key1", "key2", "key3"], validate=False)
+        values = valid_config.get_multiple(["key1", "key2", "key3"], validate=False)
 
         assert values == ("value1", "value2", "value3")
 
@@ -103,31 +85,42 @@ stats_path = "/path/to/stats"
         with pytest.raises(ConfigError, match="Configuration key 'key2' not found"):
             config.get_multiple(["key1", "key2"], validate=False)
 
-    def test_all_keys(self, tmp_path):
+    def test_all_keys(self, valid_config):
         """Test getting all configuration keys."""
-        config_file = tmp_path / "config"
-        config_file.write_text('key1="value1"\nkey2="value2"\n# comment\nkey3="value3"')
-
-        config = Config(str(config_file))
-        keys = config.all_keys
-
-        assert set(keys) == {"key1", "key2", "key3"}
+        keys = valid_config.all_keys
+
+        assert keys == (
+            "mozilla_firefox_path",
+            "l10n_path",
+            "stats_path",
+            "key1",
+            "key2",
+            "key3",
+            "double_quoted",
+            "single_quoted",
+            "no_quotes",
+        )
 
-    def test_strips_quotes(self, tmp_path):
+    def test_strips_quotes(self, valid_config):
         """Test that quotes are stripped from values."""
+        config = valid_config
+        assert config.get("double_quoted", validate=False) == "value with double quotes"
+        assert config.get("single_quoted", validate=False) == "value with single quotes"
+        assert config.get("no_quotes", validate=False) == "value without quotes"
+
+    def test_strips_quotes_mixed(self, tmp_path):
+        """Test that only the outer quotes are stripped from values."""
         config_file = tmp_path / "config"
         config_file.write_text(
-            """
-double_quoted="value with double quotes"
-single_quoted='value with single quotes'
-no_quotes=value without quotes
-"""
+            'spaced=" spaced "\n'
+            'single_inside="has\'inside"\n'
+            "double_inside='has\"inside'\n"
         )
 
         config = Config(str(config_file))
-        assert config.get("double_quoted", validate=False) == "value with double quotes"
-        assert config.get("single_quoted", validate=False) == "value with single quotes"
-        assert config.get("no_quotes", validate=False) == "value without quotes"
+        assert config.get("spaced", validate=False) == " spaced "
+        assert config.get("single_inside", validate=False) == "has'inside"
+        assert config.get("double_inside", validate=False) == 'has"inside'
 
     def test_empty_config_file(self, tmp_path):
         """Test loading empty config file."""
@@ -136,3 +129,27 @@ no_quotes=value without quotes
 
         config = Config(str(config_file))
         assert len(config.all_keys) == 0
+
+    def test_reloads_modified_file(self, tmp_path):
+        """Test that cached parsing picks up changes to the file."""
+        config_file = tmp_path / "config"
+        config_file.write_text('key1="value1"')
+        assert Config(str(config_file)).get("key1", validate=False) == "value1"
+
+        config_file.write_text('key1="changed"')
+        assert Config(str(config_file)).get("key1", validate=False) == "changed"
+
+    def test_validates_each_path_once(self, tmp_path):
+        """Test that a path shared by several keys is only checked once."""
+        config_file = tmp_path / "config"
+        config_file.write_text(f'key1="{tmp_path}"\nkey2="{tmp_path}"')
+
+        config = Config(str(config_file))
+        with patch("config.os.path.exists", wraps=os.path.exists) as mock_exists:
+            assert config.get_multiple(["key1", "key2"]) == (
+                str(tmp_path),
+                str(tmp_path),
+            )
+            config.get("key1")
+
+        mock_exists.assert_called_once_with(str(tmp_path))
@@ -2,43 +2,69 @@
 
 import json
 import os
-
-# Add parent directory to path to import scripts
-import sys
+import subprocess
 
 from unittest.mock import patch
 
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+import pytest
 
 from functions import (
+    find_existing_files,
+    get_firefox_releases,
     get_json_files,
+    get_stats_files,
     get_stats_path,
     get_version_from_filename,
+    load_stats_file,
+    parse_file_ids,
     store_completion,
+    store_file_ids,
 )
 
 
-class TestGetVersionFromFilename:
-    """Tests for get_version_from_filename function."""
+# String lists shared by tests, store_completion() doesn't modify them
+TWO_FILES_STRING_LIST = {
+    "file1.ftl": {
+        "source": {"msg1", "msg2", "msg3", "msg4"},
+        "it": {"msg1", "msg2", "msg3"},
+        "fr": {"msg1", "msg2"},
+    },
+    "file2.ftl": {
+        "source": {"msg5", "msg6"},
+        "it": {"msg5", "msg6"},
+        "fr": {"msg5"},
+    },
+}
+ONE_FILE_STRING_LIST = {
+    "file1.ftl": {
+        "source": {"msg1", "msg2"},
+        "it": {"msg1"},
+    },
+}
 
-    def test_single_digit_version(self):
-        """Test version extraction with single digit major version."""
-        version, major = get_version_from_filename("firefox_147_0.json")
-        assert version == "147.0"
-        assert major == "147"
 
-    def test_multiple_digits_version(self):
-        """Test version extraction with multiple version components."""
-        version, major = get_version_from_filename("fenix_100_1_2.json")
-        assert version == "100.1.2"
-        assert major == "100"
+class TestGetVersionFromFilename:
+    """Tests for get_version_from_filename function."""
 
-    def test_fenix_product(self):
-        """Test version extraction for fenix product."""
-        version, major = get_version_from_filename("fenix_79_0.json")
-        assert version == "79.0"
-        assert major == "79"
+    @pytest.mark.parametrize(
+        ("filename", "expected_version", "expected_major"),
+        [
+            pytest.param("firefox_147_0.json", "147.0", "147", id="firefox"),
+            pytest.param("fenix_100_1_2.json", "100.1.2", "100", id="dot_release"),
+            pytest.param("fenix_79_0.json", "79.0", "79", id="fenix"),
+        ],
+    )
+    def test_version(self, filename, expected_version, expected_major):
+        """Test version extraction from stats filenames."""
+        version, major = get_version_from_filename(filename)
+        assert version == expected_version
+        assert major == expected_major
+
+    def test_rejects_unexpected_names(self):
+        """Test that names not matching the whole pattern are rejected."""
+        for filename in ("firefox_locales.csv", "firefox_147_0.json\n", "147_0.json"):
+            with pytest.raises(ValueError, match="Unrecognized stats filename"):
+                get_version_from_filename(filename)
 
 
 class TestGetStatsPath:
@@ -54,36 +80,22 @@ class TestGetStatsPath:
         path = get_stats_path()
         assert path.endswith("stats")
 
+    def test_cached(self):
+        """Test that the path is computed once and reused."""
+        assert get_stats_path() is get_stats_path()
+
 
 class TestStoreCompletion:
     """Tests for store_completion function."""
 
     def test_calculates_completion_percentage(self, tmp_path):
         """Test completion percentage calculation."""
-        string_list = {
-            "file1.ftl": {
-                "source": ["msg1", "msg2", "msg3", "msg4"],
-                "it": ["msg1", "msg2", "msg3"],
-                "fr": ["msg1", "msg2"],
-            },
-            "file2.ftl": {
-                "source": ["msg5", "msg6"],
-                "it": ["msg5", "msg6"],
-                "fr": ["msg5"],
-            },
-        }
         locales = ["source", "it", "fr"]
         version = "147.0"
         product = "firefox"
 
         with patch("functions.get_stats_path", return_value=str(tmp_path)):
-            store_completion(string_list, version, locales, product)
-
-        output_file = tmp_path / "firefox_147_0.json"
-        assert output_file.exists()
-
-        with open(output_file) as f:
-            data = json.load(f)
+            data = store_completion(TWO_FILES_STRING_LIST, version, locales, product)
 
         # it: 5/6 = 0.8333
         # fr: 3/6 = 0.5
@@ -92,26 +104,48 @@ class TestStoreCompletion:
 
     def test_excludes_source_locale(self, tmp_path):
         """Test that 'source' locale is not included in output."""
-        string_list = {
-            "file1.ftl": {
-                "source": ["msg1", "msg2"],
-                "it": ["msg1"],
-            },
-        }
         locales = ["source", "it"]
         version = "100.0"
         product = "fenix"
 
         with patch("functions.get_stats_path", return_value=str(tmp_path)):
-            store_completion(string_list, version, locales, product)
-
-        output_file = tmp_path / "fenix_100_0.json"
-        with open(output_file) as f:
-            data = json.load(f)
+            data = store_completion(ONE_FILE_STRING_LIST, version, locales, product)
 
         assert "source" not in data
         assert "it" in data
 
+    def test_completion_with_many_files(self, tmp_path):
+        """Test that counts are summed across many files."""
+        string_list = {
+            f"file{i}.ftl": {
+                "source": {f"id{i}-a", f"id{i}-b"},
+                "it": {f"id{i}-a", f"id{i}-b"} if i % 2 else {f"id{i}-a"},
+            }
+            for i in range(1000)
+        }
+
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            data = store_completion(string_list, "147.0", ["source", "it"], "firefox")
+
+        # it: (500 * 2 + 500 * 1) / 2000 = 0.75
+        assert data == {"it": 0.75}
+
+    def test_writes_file(self, tmp_path):
+        """Test that the returned statistics are written to the stats folder."""
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            data = store_completion(
+                TWO_FILES_STRING_LIST, "147.0", ["source", "it", "fr"], "firefox"
+            )
+
+        output_file = tmp_path / "firefox_147_0.json"
+        assert output_file.exists()
+
+        with open(output_file) as f:
+            assert json.load(f) == data
+
+        # Same separators as the existing stats files
+        assert output_file.read_text() == '{"it": 0.8333, "fr": 0.5}'
+
 
 class TestGetJsonFiles:
     """Tests for get_json_files function."""
@@ -122,6 +156,7 @@ class TestGetJsonFiles:
         (tmp_path / "firefox_100_0.json").touch()
         (tmp_path / "firefox_101_0.json").touch()
         (tmp_path / "fenix_100_0.json").touch()
+        (tmp_path / "firefoxdev_100_0.json").touch()
         (tmp_path / "other.json").touch()
 
         with patch("functions.get_stats_path", return_value=str(tmp_path)):
@@ -148,3 +183,193 @@ class TestGetJsonFiles:
             "firefox_101_0.json",
             "firefox_102_0.json",
         ]
+
+    def test_skips_directories_and_symlinks(self, tmp_path):
+        """Test that only regular files are returned."""
+        (tmp_path / "firefox_100_0.json").touch()
+        (tmp_path / "firefox_101_0.json").mkdir()
+        (tmp_path / "firefox_102_0.json").symlink_to(tmp_path / "firefox_100_0.json")
+
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            files = get_json_files("firefox")
+
+        assert files == ["firefox_100_0.json"]
+
+
+class TestGetStatsFiles:
+    """Tests for get_stats_files function."""
+
+    def test_groups_by_product(self, tmp_path):
+        """Test that files are bucketed per product in a single call."""
+        (tmp_path / "firefox_101_0.json").touch()
+        (tmp_path / "firefox_100_0.json").touch()
+        (tmp_path / "fenix_100_0.json").touch()
+        (tmp_path / "firefox_locales.csv").touch()
+        (tmp_path / "other_100_0.json").touch()
+
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            stats_files = get_stats_files(["fenix", "firefox"])
+
+        assert stats_files == {
+            "fenix": ["fenix_100_0.json"],
+            "firefox": ["firefox_100_0.json", "firefox_101_0.json"],
+        }
+
+    def test_product_without_files(self, tmp_path):
+        """Test that requested products are always present in the result."""
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            stats_files = get_stats_files(["fenix"])
+
+        assert stats_files == {"fenix": []}
+
+    def test_filters_by_major_version(self, tmp_path):
+        """Test that files outside the requested major versions are skipped."""
+        (tmp_path / "firefox_99_0.json").touch()
+        (tmp_path / "firefox_100_0.json").touch()
+        (tmp_path / "firefox_100_0_2.json").touch()
+        (tmp_path / "firefox_101_0.json").touch()
+
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            stats_files = get_stats_files(["firefox"], {"100", "101"})
+
+        assert stats_files == {
+            "firefox": [
+                "firefox_100_0.json",
+                "firefox_100_0_2.json",
+                "firefox_101_0.json",
+            ]
+        }
+
+    def test_skips_directories_and_symlinks(self, tmp_path):
+        """Test that only regular files are returned."""
+        (tmp_path / "firefox_100_0.json").touch()
+        (tmp_path / "firefox_101_0.json").mkdir()
+        (tmp_path / "fenix_100_0.json").symlink_to(tmp_path / "firefox_100_0.json")
+
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            stats_files = get_stats_files(["fenix", "firefox"])
+
+        assert stats_files == {"fenix": [], "firefox": ["firefox_100_0.json"]}
+
+
+class TestLoadStatsFile:
+    """Tests for load_stats_file function."""
+
+    def test_round_trip(self, tmp_path):
+        """Test that files written by store_completion can be read back."""
+        with patch("functions.get_stats_path", return_value=str(tmp_path)):
+            store_completion(ONE_FILE_STRING_LIST, "147.0", ["source", "it"], "firefox")
+
+        assert load_stats_file(str(tmp_path / "firefox_147_0.json")) == {"it": 0.5}
+
+
+ANDROID_SOURCE = """<?xml version="1.0" encoding="utf-8"?>
+<resources xmlns:tools="http://schemas.android.com/tools" xmlns:moz="http://mozac.org/tools">
+    <string name="kept">Kept</string>
+    <string name="removed" moz:removedIn="140">Removed</string>
+    <string name="future" moz:removedIn="160">Future</string>
+    <string name="unused" tools:ignore="UnusedResources,Other">Unused</string>
+</resources>
+"""
+
+
+class TestParseFile:
+    """Tests for parse_file_ids and store_file_ids functions."""
+
+    def test_ftl_with_attributes(self, tmp_path):
+        """Test that Fluent attributes are stored as separate IDs."""
+        source = tmp_path / "source.ftl"
+        source.write_text("msg = Message\n    .title = Title\nother = Other\n")
+        target = tmp_path / "it.ftl"
+        target.write_text("msg = Messaggio\n    .title = Titolo\nextra = Extra\n")
+
+        string_list = {}
+        for path, locale in ((source, "source"), (target, "it")):
+            ids = parse_file_ids(str(path), "file.ftl", locale)
+            store_file_ids(string_list, "file.ftl", locale, ids)
+
+        assert string_list["file.ftl"]["source"] == {"msg", "msg.title", "other"}
+        assert string_list["file.ftl"]["it"] == {"msg", "msg.title"}
+
+    def test_android_meta_filters(self, tmp_path):
+        """Test that removed and unused Android strings are skipped."""
+        source = tmp_path / "strings.xml"
+        source.write_text(ANDROID_SOURCE)
+
+        ids = parse_file_ids(str(source), "strings.xml", "source", "150.0")
+
+        assert ids == ["kept", "future"]
+
+    def test_locale_ids_are_not_filtered(self, tmp_path):
+        """Test that locale IDs are only filtered when stored."""
+        target = tmp_path / "it.ftl"
+        target.write_text("msg = Messaggio\nextra = Extra\n")
+
+        ids = parse_file_ids(str(target), "file.ftl", "it")
+        assert ids == ["msg", "extra"]
+
+        string_list = {"file.ftl": {"source": {"msg", "other"}}}
+        store_file_ids(string_list, "file.ftl", "it", ids)
+        assert string_list["file.ftl"]["it"] == {"msg"}
+
+    def test_unsupported_format(self, tmp_path):
+        """Test that unsupported files produce no IDs."""
+        source = tmp_path / "readme.unknownext"
+        source.write_text("Not a localization file\n")
+
+        ids = parse_file_ids(str(source), "readme.unknownext", "source")
+        assert ids == []
+
+        string_list = {}
+        store_file_ids(string_list, "readme.unknownext", "source", ids)
+        assert string_list == {"readme.unknownext": {"source": set()}}
+
+
+class TestFindExistingFiles:
+    """Tests for find_existing_files function."""
+
+    def test_finds_existing_files(self, tmp_path):
+        """Test that only existing paths are returned."""
+        (tmp_path / "a.ftl").write_text("")
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "sub" / "b.ftl").write_text("")
+
+        paths = [
+            str(tmp_path / "a.ftl"),
+            str(tmp_path / "missing.ftl"),
+            str(tmp_path / "sub" / "b.ftl"),
+            str(tmp_path / "missing" / "c.ftl"),
+            str(tmp_path / "a.ftl" / "d.ftl"),
+        ]
+
+        assert find_existing_files(paths) == {paths[0], paths[2]}
+
+
+class TestGetFirefoxReleases:
+    """Tests for get_firefox_releases function."""
+
+    def test_extracts_release_tags(self):
+        """Test that only release tags are mapped to their version."""
+        stdout = "\n".join(
+            [
+                "FIREFOX_146_0_RELEASE",
+                "FIREFOX_147_0_1_RELEASE",
+                "FIREFOX_147_0b1_RELEASE",
+                "FIREFOX_BETA_147_BASE",
+            ]
+        )
+        completed = subprocess.CompletedProcess([], 0, stdout=stdout, stderr="")
+        with patch("functions.subprocess.run", return_value=completed):
+            releases = get_firefox_releases("/repo")
+
+        assert releases == {
+            "146.0": "FIREFOX_146_0_RELEASE",
+            "147.0.1": "FIREFOX_147_0_1_RELEASE",
+        }
+
+    def test_git_error(self):
+        """Test that a failing git command raises RuntimeError."""
+        completed = subprocess.CompletedProcess([], 1, stdout="", stderr="fatal")
+        with patch("functions.subprocess.run", return_value=completed):
+            with pytest.raises(RuntimeError):
+                get_firefox_releases("/repo")
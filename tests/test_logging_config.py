@@ -1,49 +1,58 @@
 """Tests for logging_config module."""
 
 import logging
+import multiprocessing
 import os
-import sys
 
+from concurrent.futures import ProcessPoolExecutor
 from unittest.mock import patch
 
+import pytest
 
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "scripts"))
+from logging_config import (
+    DEFAULT_FORMAT,
+    _resolve_level,
+    get_logger,
+    get_worker_logging_args,
+    setup_logging,
+)
 
-from logging_config import get_logger, setup_logging
+
+@pytest.fixture(autouse=True)
+def restore_root_logger():
+    """Restore the root logger after each test, closing handlers it added."""
+    root_logger = logging.getLogger()
+    level = root_logger.level
+    handlers = list(root_logger.handlers)
+    yield
+    for handler in root_logger.handlers:
+        if handler not in handlers:
+            handler.close()
+    root_logger.handlers[:] = handlers
+    root_logger.setLevel(level)
 
 
 class TestSetupLogging:
     """Tests for setup_logging function."""
 
-    def test_default_setup(self):
-        """Test default logging configuration."""
-        setup_logging()
+    @pytest.mark.parametrize(
+        ("kwargs", "env", "expected"),
+        [
+            pytest.param({}, {}, logging.INFO, id="default"),
+            pytest.param({"level": "DEBUG"}, {}, logging.DEBUG, id="level_string"),
+            pytest.param(
+                {"level": logging.WARNING}, {}, logging.WARNING, id="level_int"
+            ),
+            pytest.param({}, {"LOG_LEVEL": "ERROR"}, logging.ERROR, id="env_var"),
+        ],
+    )
+    def test_log_level(self, kwargs, env, expected):
+        """Test the log level from arguments, environment or default."""
+        with patch.dict(os.environ, env):
+            setup_logging(**kwargs)
 
-        # Check root logger level
         root_logger = logging.getLogger()
-        assert root_logger.level == logging.INFO
-
-    def test_custom_level_string(self):
-        """Test setting custom log level with string."""
-        setup_logging(level="DEBUG")
-
-        root_logger = logging.getLogger()
-        assert root_logger.level == logging.DEBUG
-
-    def test_custom_level_int(self):
-        """Test setting custom log level with int."""
-        setup_logging(level=logging.WARNING)
-
-        root_logger = logging.getLogger()
-        assert root_logger.level == logging.WARNING
-
-    def test_level_from_env_var(self):
-        """Test reading log level from environment variable."""
-        with patch.dict(os.environ, {"LOG_LEVEL": "ERROR"}):
-            setup_logging()
-
-            root_logger = logging.getLogger()
-            assert root_logger.level == logging.ERROR
+        assert root_logger.level == expected
 
     def test_verbose_format(self):
         """Test verbose format includes file and line info."""
@@ -81,6 +90,15 @@ class TestSetupLogging:
             content = log_file.read_text()
             assert "Environment log" in content
 
+    def test_log_file_opened_on_first_record(self, tmp_path):
+        """Test that the log file is only created when something is logged."""
+        log_file = tmp_path / "delayed.log"
+        setup_logging(log_file=str(log_file))
+        assert not log_file.exists()
+
+        get_logger("test_delay").info("First record")
+        assert "First record" in log_file.read_text()
+
     def test_log_file_creates_directories(self, tmp_path):
         """Test that parent directories are created for log file."""
         log_file = tmp_path / "nested" / "dirs" / "test.log"
@@ -101,6 +119,51 @@ class TestSetupLogging:
         assert logging.getLogger("gspread").level == logging.WARNING
 
 
+class TestResolveLevel:
+    """Tests for _resolve_level function."""
+
+    @pytest.mark.parametrize(
+        ("level", "env", "expected"),
+        [
+            pytest.param(None, {}, logging.INFO, id="default"),
+            pytest.param(None, {"LOG_LEVEL": "ERROR"}, logging.ERROR, id="env"),
+            pytest.param(None, {"LOG_LEVEL": "debug"}, logging.DEBUG, id="lowercase"),
+            pytest.param(None, {"LOG_LEVEL": "NOPE"}, logging.INFO, id="unknown"),
+            pytest.param("WARNING", {"LOG_LEVEL": "ERROR"}, logging.WARNING, id="str"),
+            pytest.param(15, {"LOG_LEVEL": "ERROR"}, 15, id="int"),
+        ],
+    )
+    def test_resolve_level(self, level, env, expected):
+        """Test that explicit levels win over LOG_LEVEL, then INFO."""
+        assert _resolve_level(level, env) == expected
+
+
+class TestGetWorkerLoggingArgs:
+    """Tests for get_worker_logging_args function."""
+
+    def test_returns_resolved_settings(self, tmp_path):
+        """Test that the arguments match the last setup_logging call."""
+        log_file = str(tmp_path / "test.log")
+        setup_logging(level="DEBUG", log_file=log_file)
+
+        assert get_worker_logging_args() == (logging.DEBUG, DEFAULT_FORMAT, log_file)
+
+    def test_spawned_worker_logs_to_file(self, tmp_path):
+        """Test that spawned workers log with the main process configuration."""
+        log_file = tmp_path / "worker.log"
+        setup_logging(log_file=str(log_file))
+
+        with ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=setup_logging,
+            initargs=get_worker_logging_args(),
+        ) as executor:
+            executor.submit(get_logger("worker").warning, "From worker").result()
+
+        assert "WARNING - From worker" in log_file.read_text()
+
+
 class TestGetLogger:
     """Tests for get_logger function."""
 